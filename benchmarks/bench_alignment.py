@@ -0,0 +1,67 @@
+# Copyright 2023 FUJITSU LIMITED
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of Intel Corporation nor the names of its contributors
+#       may be used to endorse or promote products derived from this software
+#       without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''
+Throughput of the contiguous SLEEF kernels for inputs misaligned by a few
+elements, such as a[1:], against vector-aligned inputs.
+
+Inputs of at least SLEEF_ALIGN_THRESHOLD bytes are peeled to vector
+alignment, smaller ones run unpeeled.
+
+Usage: python benchmarks/bench_alignment.py
+'''
+
+import numpy as np
+import mkl_umath._ufuncs as mu
+
+from common import aligned_empty, best_time, melems
+
+functions = ['exp', 'log', 'sqrt']
+sizes = [1 << 10, 1 << 16, 1 << 24]
+offsets = [0, 1, 3]
+
+
+def main():
+    print('{:>6} {:>6} {:>10} {:>8} {:>8} {:>10}'.format(
+        'func', 'type', 'n', 'offset', 'Melem/s', 'vs aligned'))
+    for name in functions:
+        umath = getattr(mu, name)
+        for dtype in (np.single, np.double):
+            for n in sizes:
+                dst = aligned_empty(n, dtype)
+                base = None
+                for offset in offsets:
+                    src = aligned_empty(n, dtype, offset=offset)
+                    src[...] = np.random.random_sample(n) + 0.5
+                    rate = melems(n, best_time(umath, src, out=dst))
+                    if base is None:
+                        base = rate
+                    print('{:>6} {:>6} {:>10} {:>8} {:>8.1f} {:>10.2f}'.format(
+                        name, np.dtype(dtype).char, n, offset, rate,
+                        rate / base))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# Copyright 2023 FUJITSU LIMITED
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of Intel Corporation nor the names of its contributors
+#       may be used to endorse or promote products derived from this software
+#       without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''
+Throughput of the contiguous SLEEF kernels for cheap (sqrt, cbrt) and
+expensive (tan, arctanh) functions against NumPy.
+
+The unroll factor of each kernel is chosen at build time, e.g. run this
+script on builds with CFLAGS=-DSLEEF_UNROLL_tan_f64=1 and the default one
+to see the gain of unrolling.
+
+Usage: python benchmarks/bench_contig.py
+'''
+
+import numpy as np
+import numpy.core.umath as nu
+import mkl_umath._ufuncs as mu
+
+from common import best_time, melems
+
+functions = ['sqrt', 'cbrt', 'tan', 'arctanh']
+sizes = [1 << 10, 1 << 14, 1 << 20]
+
+
+def main():
+    print('{:>8} {:>6} {:>10} {:>10} {:>10} {:>8}'.format(
+        'func', 'type', 'n', 'numpy', 'mkl_umath', 'speedup'))
+    for name in functions:
+        for dtype in (np.single, np.double):
+            for n in sizes:
+                src = dtype(np.random.random_sample(n) * 0.9)
+                dst = np.empty_like(src)
+                ref = melems(n, best_time(getattr(nu, name), src, out=dst))
+                rate = melems(n, best_time(getattr(mu, name), src, out=dst))
+                print('{:>8} {:>6} {:>10} {:>10.1f} {:>10.1f} {:>8.2f}'.format(
+                    name, np.dtype(dtype).char, n, ref, rate, rate / ref))
+
+
+if __name__ == '__main__':
+    main()
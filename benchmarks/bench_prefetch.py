@@ -0,0 +1,78 @@
+# Copyright 2023 FUJITSU LIMITED
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of Intel Corporation nor the names of its contributors
+#       may be used to endorse or promote products derived from this software
+#       without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+'''
+Sweep of the software prefetch distance of the SLEEF loops, reporting for
+each function and layout the distance with the best throughput and its gain
+over the loops without software prefetch.
+
+Operands should be larger than the last-level cache for prefetch to matter.
+The best distance can then be set with the MKL_UMATH_PREFETCH=1 and
+MKL_UMATH_PREFETCH_DISTANCE environment variables.
+
+Usage: python benchmarks/bench_prefetch.py [n]
+'''
+
+import sys
+
+import numpy as np
+import mkl_umath._ufuncs as mu
+
+from common import best_time, strided, melems
+
+functions = ['sin', 'exp', 'log', 'sqrt']
+distances = [1, 2, 4, 8, 16, 32, 64, 128]
+strides = [1, 4]
+
+
+def main(n):
+    print('{:>6} {:>6} {:>8} {:>10} {:>10} {:>10} {:>8}'.format(
+        'func', 'type', 'stride', 'off', 'best', 'distance', 'speedup'))
+    old = mu.get_prefetch_enabled(), mu.get_prefetch_distance()
+    try:
+        for name in functions:
+            umath = getattr(mu, name)
+            for dtype in (np.single, np.double):
+                for stride in strides:
+                    src = strided(n, stride, dtype,
+                                  fill=np.random.random_sample(n) + 0.5)
+                    dst = strided(n, stride, dtype)
+                    mu.set_prefetch_enabled(False)
+                    off = melems(n, best_time(umath, src, out=dst))
+                    mu.set_prefetch_enabled(True)
+                    rates = []
+                    for distance in distances:
+                        mu.set_prefetch_distance(distance)
+                        rates.append(melems(n, best_time(umath, src, out=dst)))
+                    best = max(range(len(distances)), key=rates.__getitem__)
+                    print('{:>6} {:>6} {:>8} {:>10.1f} {:>10.1f} {:>10} {:>8.2f}'.format(
+                        name, np.dtype(dtype).char, stride, off, rates[best],
+                        distances[best], rates[best] / off))
+    finally:
+        mu.set_prefetch_enabled(old[0])
+        mu.set_prefetch_distance(old[1])
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1 << 22)
@@ -0,0 +1,64 @@
+# Copyright 2023 FUJITSU LIMITED
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of Intel Corporation nor the names of its contributors
+#       may be used to endorse or promote products derived from this software
+#       without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''
+Throughput of the SLEEF loops for strided operands against the contiguous
+path.
+
+Usage: python benchmarks/bench_strides.py [n]
+'''
+
+import sys
+
+import numpy as np
+import mkl_umath._ufuncs as mu
+
+from common import best_time, strided, melems
+
+functions = ['sin', 'exp', 'log', 'sqrt']
+strides = [2, 3, 8, 64]
+
+
+def main(n):
+    print('{:>6} {:>6} {:>10} {:>8} {:>12}'.format(
+        'func', 'type', 'stride', 'Melem/s', 'vs contig'))
+    for name in functions:
+        umath = getattr(mu, name)
+        for dtype in (np.single, np.double):
+            src = dtype(np.random.random_sample(n) + 0.5)
+            dst = np.empty_like(src)
+            contig = melems(n, best_time(umath, src, out=dst))
+            print('{:>6} {:>6} {:>10} {:>8.1f} {:>12}'.format(
+                name, np.dtype(dtype).char, 1, contig, '1.00'))
+            for stride in strides:
+                ssrc = strided(n, stride, dtype, fill=src)
+                sdst = strided(n, stride, dtype)
+                rate = melems(n, best_time(umath, ssrc, out=sdst))
+                print('{:>6} {:>6} {:>10} {:>8.1f} {:>12.2f}'.format(
+                    name, np.dtype(dtype).char, stride, rate, rate / contig))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1 << 20)
@@ -0,0 +1,70 @@
+# Copyright 2023 FUJITSU LIMITED
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of Intel Corporation nor the names of its contributors
+#       may be used to endorse or promote products derived from this software
+#       without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''
+Helpers shared by the benchmark scripts.
+'''
+
+import timeit
+
+import numpy as np
+
+
+def best_time(func, *args, repeat=5, **kwargs):
+    '''
+    Returns the best time in seconds of one call of func(*args, **kwargs).
+    '''
+    timer = timeit.Timer(lambda: func(*args, **kwargs))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def strided(n, stride, dtype, fill=None):
+    '''
+    Returns a view of n elements of dtype that are stride elements apart.
+    '''
+    base = np.empty(n * abs(stride), dtype=dtype)
+    view = base[::stride]
+    if fill is not None:
+        view[...] = fill
+    return view
+
+
+def aligned_empty(n, dtype, alignment=256, offset=0):
+    '''
+    Returns n uninitialized elements of dtype starting offset elements after
+    an address aligned to alignment bytes.
+    '''
+    itemsize = np.dtype(dtype).itemsize
+    buf = np.empty((n + offset) * itemsize + alignment, dtype=np.uint8)
+    start = -buf.ctypes.data % alignment + offset * itemsize
+    return buf[start:start + n * itemsize].view(dtype)
+
+
+def melems(n, seconds):
+    '''
+    Throughput in millions of elements per second.
+    '''
+    return n / seconds * 1e-6
@@ -151,6 +151,8 @@ def TD(types, f=None, astype=None, in_=None, out=None, simd=None):
     if f is not None:
         if isinstance(f, str):
             func_data = build_func_data(types, f)
+        elif f is FullTypeDescr:
+            func_data = (f,) * len(types)
         elif len(f) != len(types):
             raise ValueError("Number of types and f do not match")
         else:
@@ -299,6 +301,8 @@ cmplxO = cmplx + O
 cmplxP = cmplx + P
 inexact = flts + cmplx
 inexactvec = 'fd'
+halfvec = 'e'
+intvec = 'ilq'
 noint = inexact+O
 nointP = inexact+P
 allP = bints+times+flts+cmplxP
@@ -321,136 +325,465 @@ for code in 'bhilq':
         uint64 = english_upper(code)
         break
 
+# Loops built for a fixed SVE vector length, which replace the vector length
+# agnostic ones when the CPU has vectors of that length (see loops_intel.h)
+sve_vls = [(vl, halfvec + intvec + inexactvec + cmplxvec)
+           for vl in ('vl128', 'vl256', 'vl512')]
+
 # This dictionary describes all the ufunc implementations, generating
 # all the function names and their corresponding ufunc signatures.  TD is
 # an object which expands a list of character codes into an array of
 # TypeDescriptions.
+#
+# The mixed precision loops (f->d and d->f) convert the operands in the
+# kernels. They are listed last, so that NumPy picks them only when the
+# output type is given with `dtype` or `signature`. The integer loops to
+# double come before the double loop so that they replace NumPy's cast of
+# int32 and int64 inputs, the narrower integers keep their half and float
+# loops and i->f is only picked with an explicit float32 output.
 defdict = {
 'arccos':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.arccos'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'arccosh':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.arccosh'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'arcsin':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.arcsin'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'arcsinh':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.arcsinh'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'arctan':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.arctan'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'arctanh':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.arctanh'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'cos':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.cos'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'sin':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.sin'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'tan':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.tan'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'cosh':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.cosh'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'sinh':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.sinh'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'tanh':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.tanh'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'exp':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.exp'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'exp2':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.exp2'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'expm1':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.expm1'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'log':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.log'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'log2':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.log2'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'log10':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.log10'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'log1p':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.log1p'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'sqrt':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.sqrt'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD(cmplxvec, simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
           ),
 'cbrt':
     Ufunc(1, 1, None,
           docstrings.get('numpy.core.umath.cbrt'),
           None,
-          TD(inexactvec),
+          TD(halfvec, simd=sve_vls),
+          TD('f', simd=sve_vls),
+          TD(intvec, f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', simd=sve_vls),
+          TD('f', f=FullTypeDescr, out='d', simd=sve_vls),
+          TD('d', f=FullTypeDescr, out='f', simd=sve_vls),
+          TD('i', f=FullTypeDescr, out='f', simd=sve_vls),
+          ),
+'erf':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.erf'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'erfc':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.erfc'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'tgamma':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.tgamma'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'lgamma':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.lgamma'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'sinpi':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.sinpi'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'cospi':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.cospi'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'exp10':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.exp10'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'sind':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.sind'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'cosd':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.cosd'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'tand':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.tand'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'arcsind':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.arcsind'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'arccosd':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.arccosd'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'arctand':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.arctand'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'rsqrt':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.rsqrt'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'reciprocal':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.reciprocal'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'recip':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.recip'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'expit':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.expit'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'softplus':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.softplus'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'gelu':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.gelu'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'gelu_tanh':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.gelu_tanh'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'silu':
+    Ufunc(1, 1, None,
+          docstrings.get('mkl_umath.silu'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'power':
+    Ufunc(2, 1, None,
+          docstrings.get('numpy.core.umath.power'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'arctan2':
+    Ufunc(2, 1, None,
+          docstrings.get('numpy.core.umath.arctan2'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'hypot':
+    Ufunc(2, 1, None,
+          docstrings.get('numpy.core.umath.hypot'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'fmod':
+    Ufunc(2, 1, None,
+          docstrings.get('numpy.core.umath.fmod'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'fma':
+    Ufunc(3, 1, None,
+          docstrings.get('mkl_umath.fma'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'sincos':
+    Ufunc(1, 2, None,
+          docstrings.get('mkl_umath.sincos'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'logaddexp':
+    Ufunc(2, 1, MinusInfinity,
+          docstrings.get('numpy.core.umath.logaddexp'),
+          None,
+          TD(inexactvec, simd=sve_vls),
+          ),
+'logaddexp2':
+    Ufunc(2, 1, MinusInfinity,
+          docstrings.get('numpy.core.umath.logaddexp2'),
+          None,
+          TD(inexactvec, simd=sve_vls),
           ),
 }
 
@@ -511,31 +844,32 @@ def make_arrays(funcdict):
         sub = 0
 
         for t in uf.type_descriptions:
+            cfunc = None
             if t.func_data is FullTypeDescr:
                 tname = english_upper(chartoname[t.type])
                 datalist.append('(void *)NULL')
-                funclist.append(
-                        '%s_%s_%s_%s' % (tname, t.in_, t.out, name))
+                cfunc = '%s_%s_%s_%s' % (tname, t.in_, t.out, name)
             elif isinstance(t.func_data, FuncNameSuffix):
                 datalist.append('(void *)NULL')
                 tname = english_upper(chartoname[t.type])
-                funclist.append(
-                        '%s_%s_%s' % (tname, name, t.func_data.suffix))
+                cfunc = '%s_%s_%s' % (tname, name, t.func_data.suffix)
             elif t.func_data is None:
                 datalist.append('(void *)NULL')
                 tname = english_upper(chartoname[t.type])
-                funclist.append('%s_%s' % (tname, name))
+                cfunc = '%s_%s' % (tname, name)
+            if cfunc is not None:
+                funclist.append(cfunc)
                 if t.simd is not None:
                     for vt in t.simd:
                         code2list.append(textwrap.dedent("""\
                         #ifdef HAVE_ATTRIBUTE_TARGET_{ISA}
                         if (NPY_CPU_HAVE({ISA})) {{
-                            {fname}_functions[{idx}] = {type}_{fname}_{isa};
+                            {fname}_functions[{idx}] = {cfunc}_{isa};
                         }}
                         #endif
                         """).format(
                             ISA=vt.upper(), isa=vt,
-                            fname=name, type=tname, idx=k
+                            fname=name, cfunc=cfunc, idx=k
                         ))
             else:
                 funclist.append('NULL')
@@ -28,6 +28,7 @@
 import sys
 from os import (getcwd, environ, makedirs)
 from os.path import join, exists, abspath, dirname
+from shutil import copyfile
 import importlib.machinery # requires Python >= 3.4
 from distutils.dep_util import newer
 
@@ -109,6 +110,14 @@ def configuration(parent_package='',top_path=None):
 
     numpy_include_dir = get_numpy_include()
     python_include_dir = get_python_include()
+    macros = getattr(config, 'define_macros', getattr(config.get_distribution(), 'define_macros', []))
+    loops_depends = [
+        join(wdir, 'blocking_utils.h'),
+        join(wdir, 'fast_loop_macros.h'),
+        join(wdir, 'memory.h'),
+        join(numpy_include_dir, 'numpy', '*object.h'),
+        join(python_include_dir, "Python.h")
+    ]
     config.add_library(
         'loops_intel',
         sources = [
@@ -116,17 +125,43 @@ def configuration(parent_package='',top_path=None):
             join(wdir, 'loops_intel.c.src'),
         ],
         include_dirs = [wdir] + [mkl_include_dirs] + [numpy_include_dir, python_include_dir],
-        depends = [
-            join(wdir, 'blocking_utils.h'),
-            join(wdir, 'fast_loop_macros.h'),
-            join(numpy_include_dir, 'numpy', '*object.h'),
-            join(python_include_dir, "Python.h")
-        ],
+        depends = loops_depends,
         libraries=mkl_libraries,
         extra_compiler_args=eca,
-        macros=getattr(config, 'define_macros', getattr(config.get_distribution(), 'define_macros', []))
+        macros=macros
     )
 
+    # copies of the loops built for a fixed SVE vector length, selected at
+    # import when the CPU has vectors of that length
+    def copy_loops_src(vl):
+        def generate(lib, build_dir):
+            target_dir = join(build_dir, 'src')
+            target = join(target_dir, 'loops_intel_vl{}.c.src'.format(vl))
+            source = join(wdir, 'loops_intel.c.src')
+            if not exists(target_dir):
+                makedirs(target_dir)
+            if newer(source, target):
+                copyfile(source, target)
+            return target
+        return generate
+
+    vl_libraries = []
+    for vl in (128, 256, 512):
+        name = 'loops_intel_vl{}'.format(vl)
+        config.add_library(
+            name,
+            sources = [
+                join(wdir, 'loops_intel.h.src'),
+                copy_loops_src(vl),
+            ],
+            include_dirs = [wdir] + [mkl_include_dirs] + [numpy_include_dir, python_include_dir],
+            depends = loops_depends + [join(wdir, 'loops_intel.c.src')],
+            libraries=mkl_libraries,
+            extra_compiler_args=eca + ['-msve-vector-bits={}'.format(vl)],
+            macros=macros + [('MKL_UMATH_VL', str(vl))]
+        )
+        vl_libraries.append(name)
+
     config.add_extension(
         name = '_ufuncs',
         sources = [
@@ -137,7 +172,7 @@ def configuration(parent_package='',top_path=None):
             join(wdir, 'loops_intel.h.src'),
         ],
         include_dirs = [wdir] + [mkl_include_dirs],
-        libraries = mkl_libraries + ['loops_intel'],
+        libraries = mkl_libraries + vl_libraries + ['loops_intel'],
         library_dirs = mkl_library_dirs,
         extra_compile_args = [
             '-DNDEBUG',
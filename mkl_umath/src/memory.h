@@ -30,6 +30,17 @@
 #define NPY_SIMD_MAXLOAD_STRIDE32 (0x7fffffff / 16)
 #define NPY_SIMD_MAXSTORE_STRIDE32 (0x7fffffff / 16)
 
+#define npyv_nlanes_u8 svcntb()
+#define npyv_nlanes_s8 svcntb()
+#define npyv_nlanes_u16 svcnth()
+#define npyv_nlanes_s16 svcnth()
+#define npyv_nlanes_u32 svcntw()
+#define npyv_nlanes_s32 svcntw()
+#define npyv_nlanes_f32 svcntw()
+#define npyv_nlanes_u64 svcntd()
+#define npyv_nlanes_s64 svcntd()
+#define npyv_nlanes_f64 svcntd()
+
 typedef svuint8_t npyv_u8;
 typedef svint8_t npyv_s8;
 typedef svuint16_t npyv_u16;
@@ -64,7 +75,7 @@ NPY_FINLINE svint32_t
 npyv_load_till_s32(const npy_int32 *ptr, npy_uintp nlane, npy_int32 fill)
 {
     assert(nlane > 0);
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int32_t)) {
+    if (nlane == npyv_nlanes_s32) {
         return svld1(svptrue_b32(), ptr);
     }
     else {
@@ -79,7 +90,7 @@ NPY_FINLINE svint32_t
 npyv_load_tillz_s32(const npy_int32 *ptr, npy_uintp nlane)
 {
     assert(nlane > 0);
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int32_t)) {
+    if (nlane == npyv_nlanes_s32) {
         return svld1(svptrue_b32(), ptr);
     }
     else {
@@ -93,7 +104,7 @@ NPY_FINLINE svint64_t
 npyv_load_till_s64(const npy_int64 *ptr, npy_uintp nlane, npy_int64 fill)
 {
     assert(nlane > 0);
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int64_t)) {
+    if (nlane == npyv_nlanes_s64) {
         return svld1(svptrue_b64(), ptr);
     }
     else {
@@ -108,7 +119,7 @@ NPY_FINLINE svint64_t
 npyv_load_tillz_s64(const npy_int64 *ptr, npy_uintp nlane)
 {
     assert(nlane > 0);
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int64_t)) {
+    if (nlane == npyv_nlanes_s64) {
         return svld1(svptrue_b64(), ptr);
     }
     else {
@@ -132,12 +143,12 @@ npyv_loadn_till_s32(const npy_int32 *ptr, npy_intp stride, npy_uintp nlane,
     const svint32_t idx =
             svmul_s32_x(svptrue_b32(), steps, svdup_s32((int)stride));
 
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int32_t)) {
-        return svld1_gather_s32offset_s32(svptrue_b32(), ptr, idx);
+    if (nlane == npyv_nlanes_s32) {
+        return svld1_gather_s32index_s32(svptrue_b32(), ptr, idx);
     }
     else {
         const svint32_t tmp = svindex_s32(0, 1);
-        const svbool_t mask = svcmplt_n_s32(svptrue_b64(), tmp, nlane);
+        const svbool_t mask = svcmplt_n_s32(svptrue_b32(), tmp, nlane);
         const svint32_t vfill = svdup_s32(fill);
         return svsel_s32(mask, svld1_gather_s32index_s32(mask, ptr, idx),
                          vfill);
@@ -158,10 +169,10 @@ npyv_loadn_till_s64(const npy_int64 *ptr, npy_intp stride, npy_uintp nlane,
     assert(llabs(stride) <= NPY_SIMD_MAXLOAD_STRIDE32);
     const svint64_t steps = svindex_s64(0, 1);
     const svint64_t idx =
-            svmul_s64_x(svptrue_b64(), steps, svdup_s64((int)stride));
+            svmul_s64_x(svptrue_b64(), steps, svdup_s64(stride));
 
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int64_t)) {
-        return svld1_gather_s64offset_s64(svptrue_b64(), ptr, idx);
+    if (nlane == npyv_nlanes_s64) {
+        return svld1_gather_s64index_s64(svptrue_b64(), ptr, idx);
     }
     else {
         const svint64_t tmp = svindex_s64(0, 1);
@@ -185,7 +196,7 @@ NPY_FINLINE void
 npyv_store_till_s32(npy_int32 *ptr, npy_uintp nlane, npyv_s32 a)
 {
     assert(nlane > 0);
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int32_t)) {
+    if (nlane == npyv_nlanes_s32) {
         svst1_s32(svptrue_b32(), ptr, a);
     }
     else {
@@ -199,7 +210,7 @@ NPY_FINLINE void
 npyv_store_till_s64(npy_int64 *ptr, npy_uintp nlane, npyv_s64 a)
 {
     assert(nlane > 0);
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int64_t)) {
+    if (nlane == npyv_nlanes_s64) {
         svst1_s64(svptrue_b64(), ptr, a);
     }
     else {
@@ -222,13 +233,13 @@ npyv_storen_till_s32(npy_int32 *ptr, npy_intp stride, npy_uintp nlane,
     const svint32_t idx =
             svmul_s32_x(svptrue_b32(), steps, svdup_s32((int)stride));
 
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int32_t)) {
-        svst1_scatter_s32offset_s32(svptrue_b32(), ptr, idx, a);
+    if (nlane == npyv_nlanes_s32) {
+        svst1_scatter_s32index_s32(svptrue_b32(), ptr, idx, a);
     }
     else {
         const svint32_t tmp = svindex_s32(0, 1);
-        const svbool_t mask = svcmplt_n_s32(svptrue_b64(), tmp, nlane);
-        svst1_scatter_s32offset_s32(mask, ptr, idx, a);
+        const svbool_t mask = svcmplt_n_s32(svptrue_b32(), tmp, nlane);
+        svst1_scatter_s32index_s32(mask, ptr, idx, a);
     }
 }
 //// 64
@@ -240,15 +251,15 @@ npyv_storen_till_s64(npy_int64 *ptr, npy_intp stride, npy_uintp nlane,
     assert(llabs(stride) <= NPY_SIMD_MAXLOAD_STRIDE32);
     const svint64_t steps = svindex_s64(0, 1);
     const svint64_t idx =
-            svmul_s64_x(svptrue_b64(), steps, svdup_s64((int)stride));
+            svmul_s64_x(svptrue_b64(), steps, svdup_s64(stride));
 
-    if (nlane == NPY_SIMD_WIDTH / sizeof(int64_t)) {
-        svst1_scatter_s64offset_s64(svptrue_b64(), ptr, idx, a);
+    if (nlane == npyv_nlanes_s64) {
+        svst1_scatter_s64index_s64(svptrue_b64(), ptr, idx, a);
     }
     else {
         const svint64_t tmp = svindex_s64(0, 1);
         const svbool_t mask = svcmplt_n_s64(svptrue_b64(), tmp, nlane);
-        svst1_scatter_s64offset_s64(mask, ptr, idx, a);
+        svst1_scatter_s64index_s64(mask, ptr, idx, a);
     }
 }
 
@@ -311,4 +322,42 @@ NPYV_IMPL_SVE_REST_PARTIAL_TYPES(f32, s32)
 NPYV_IMPL_SVE_REST_PARTIAL_TYPES(u64, s64)
 NPYV_IMPL_SVE_REST_PARTIAL_TYPES(f64, s64)
 
+/*********************************
+ * Reversed partial load/store
+ *********************************/
+// lane i maps to ptr[-i], the block is loaded and stored contiguously
+// through the predicated upper lanes and reversed with svrev
+#define NPYV_IMPL_SVE_REVERSED_PARTIAL(SFX, BITS)                             \
+    NPY_FINLINE svbool_t npyv_rmask_##SFX(npy_uintp nlane)                    \
+    {                                                                         \
+        const npy_intp vstep = npyv_nlanes_##SFX;                             \
+        return svnot_b_z(svptrue_b##BITS(),                                   \
+                svwhilelt_b##BITS((npy_intp)0, vstep - (npy_intp)nlane));     \
+    }                                                                         \
+    NPY_FINLINE npyv_##SFX npyv_loadr_till_##SFX(                             \
+            const npyv_lanetype_##SFX *ptr, npy_uintp nlane,                  \
+            npyv_lanetype_##SFX fill)                                         \
+    {                                                                         \
+        assert(nlane > 0);                                                    \
+        const svbool_t mask = npyv_rmask_##SFX(nlane);                        \
+        const npyv_##SFX a =                                                  \
+                svld1_##SFX(mask, ptr - (npyv_nlanes_##SFX - 1));             \
+        return svrev_##SFX(svsel_##SFX(mask, a, svdup_n_##SFX(fill)));        \
+    }                                                                         \
+    NPY_FINLINE npyv_##SFX npyv_loadr_tillz_##SFX(                            \
+            const npyv_lanetype_##SFX *ptr, npy_uintp nlane)                  \
+    {                                                                         \
+        return npyv_loadr_till_##SFX(ptr, nlane, 0);                          \
+    }                                                                         \
+    NPY_FINLINE void npyv_storer_till_##SFX(npyv_lanetype_##SFX *ptr,         \
+                                            npy_uintp nlane, npyv_##SFX a)    \
+    {                                                                         \
+        assert(nlane > 0);                                                    \
+        svst1_##SFX(npyv_rmask_##SFX(nlane),                                  \
+                    ptr - (npyv_nlanes_##SFX - 1), svrev_##SFX(a));           \
+    }
+
+NPYV_IMPL_SVE_REVERSED_PARTIAL(f32, 32)
+NPYV_IMPL_SVE_REVERSED_PARTIAL(f64, 64)
+
 //#endif  // _NPY_SIMD_SVE_MEMORY_H
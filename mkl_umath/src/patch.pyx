@@ -56,6 +56,8 @@ cdef class patch:
         self._is_patched = False
 
         umaths = [i for i in dir(mu) if isinstance(getattr(mu, i), np.ufunc)]
+        # only the ufuncs that NumPy has can be patched, e.g. not sincos or erf
+        umaths = [i for i in umaths if isinstance(getattr(nu, i, None), np.ufunc)]
         self.functions_count = 0
         for umath in umaths:
             mkl_umath = getattr(mu, umath)
@@ -88,8 +90,9 @@ cdef class patch:
                         self.functions[func_number].signature[i] = c_patch_umath.types[pi * nargs + i]
                     self.functions_dict[(umath, patch_umath.types[pi])] = func_number
                     func_number = func_number + 1
-                else:
-                    raise RuntimeError("Unable to find original function for: " + umath + " " + patch_umath.types[pi])
+                # loops that NumPy lacks, e.g. the mixed precision ones, are
+                # only available from mkl_umath's ufuncs
+        self.functions_count = func_number
 
     def __dealloc__(self):
         for i in range(self.functions_count):
@@ -27,15 +27,443 @@
 #include "Python.h"
 #include "ufuncsmodule.h"
 
+#include <stdlib.h>
+
+/*
+ * Reads a non-negative integer from the environment variable `name` into
+ * `value`, which is left untouched when the variable is unset or invalid.
+ * Returns -1 if the warning about an invalid value was turned into an error.
+ */
+static int
+getenv_intp(const char *name, npy_intp *value)
+{
+    const char *str = getenv(name);
+    char *end;
+    long long res;
+
+    if (str == NULL || *str == '\0') {
+        return 0;
+    }
+    res = strtoll(str, &end, 10);
+    if (*end != '\0' || res < 0 || res > NPY_MAX_INTP) {
+        return PyErr_WarnFormat(PyExc_RuntimeWarning, 1,
+                "ignoring %s=%s, expected a non-negative integer", name, str);
+    }
+    *value = (npy_intp)res;
+    return 0;
+}
+
+/* converts `arg` to a non-negative npy_intp, returns -1 on error */
+static npy_intp
+as_nonnegative_intp(PyObject *arg, const char *what)
+{
+    npy_intp res = PyNumber_AsSsize_t(arg, PyExc_OverflowError);
+
+    if (res == -1 && PyErr_Occurred()) {
+        return -1;
+    }
+    if (res < 0) {
+        PyErr_Format(PyExc_ValueError, "%s must be non-negative", what);
+        return -1;
+    }
+    return res;
+}
+
+static PyObject *
+set_streaming_threshold(PyObject *NPY_UNUSED(self), PyObject *arg)
+{
+    npy_intp nbytes = as_nonnegative_intp(arg, "nbytes");
+
+    if (nbytes < 0) {
+        return NULL;
+    }
+    mkl_umath_set_streaming_threshold(nbytes);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+get_streaming_threshold(PyObject *NPY_UNUSED(self), PyObject *NPY_UNUSED(args))
+{
+    return PyLong_FromSsize_t(mkl_umath_get_streaming_threshold());
+}
+
+static PyObject *
+set_prefetch_distance(PyObject *NPY_UNUSED(self), PyObject *arg)
+{
+    npy_intp nvec = as_nonnegative_intp(arg, "distance");
+
+    if (nvec < 0) {
+        return NULL;
+    }
+    if (nvec > MKL_UMATH_MAX_PREFETCH_DISTANCE) {
+        PyErr_Format(PyExc_ValueError, "distance must be at most %d",
+                     MKL_UMATH_MAX_PREFETCH_DISTANCE);
+        return NULL;
+    }
+    mkl_umath_set_prefetch_distance(nvec);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+get_prefetch_distance(PyObject *NPY_UNUSED(self), PyObject *NPY_UNUSED(args))
+{
+    return PyLong_FromSsize_t(mkl_umath_get_prefetch_distance());
+}
+
+static PyObject *
+set_prefetch_enabled(PyObject *NPY_UNUSED(self), PyObject *arg)
+{
+    int enabled = PyObject_IsTrue(arg);
+
+    if (enabled < 0) {
+        return NULL;
+    }
+    mkl_umath_set_prefetch_enabled(enabled);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+get_prefetch_enabled(PyObject *NPY_UNUSED(self), PyObject *NPY_UNUSED(args))
+{
+    return PyBool_FromLong(mkl_umath_get_prefetch_enabled());
+}
+
+static PyObject *
+set_refinement_steps(PyObject *NPY_UNUSED(self), PyObject *arg)
+{
+    npy_intp steps = -1;
+
+    if (arg != Py_None) {
+        steps = PyNumber_AsSsize_t(arg, PyExc_OverflowError);
+        if (steps == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (steps < 0 || steps > 2) {
+            PyErr_SetString(PyExc_ValueError,
+                    "steps must be 0, 1, 2 or None");
+            return NULL;
+        }
+    }
+    mkl_umath_set_refinement_steps((int)steps);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+get_refinement_steps(PyObject *NPY_UNUSED(self), PyObject *NPY_UNUSED(args))
+{
+    int steps = mkl_umath_get_refinement_steps();
+
+    if (steps < 0) {
+        Py_RETURN_NONE;
+    }
+    return PyLong_FromLong(steps);
+}
+
+static const char *reducer_names[] = {"sum", "max", "min", "maxabs"};
+#define NREDUCERS ((int)(sizeof(reducer_names) / sizeof(reducer_names[0])))
+
+/* runs mkl_umath_reduce_map_* of the data type `type`, strides in elements */
+static int
+reduce_run(int type, const char *name, int reducer, npy_intp n, npy_intp m,
+           const char *src, npy_intp sred, npy_intp sout, char *out)
+{
+    if (type == NPY_FLOAT) {
+        return mkl_umath_reduce_map_FLOAT(name, reducer, n, m,
+                (const float *)src, sred, sout, (float *)out);
+    }
+    return mkl_umath_reduce_map_DOUBLE(name, reducer, n, m,
+            (const double *)src, sred, sout, (double *)out);
+}
+
+/* combines the reductions `acc` and `r` of two parts of the input */
+static double
+reduce_combine(int reducer, double acc, double r)
+{
+    switch (reducer) {
+        case MKL_UMATH_REDUCE_SUM:
+            return acc + r;
+        case MKL_UMATH_REDUCE_MIN:
+            return npy_isnan(acc) || (!npy_isnan(r) && r >= acc) ? acc : r;
+        default:
+            return npy_isnan(acc) || (!npy_isnan(r) && r <= acc) ? acc : r;
+    }
+}
+
+/*
+ * Reduces all the elements of `arr` into the 0-d `out`, in one run if it
+ * is contiguous, otherwise in runs along its axis of smallest stride whose
+ * results are combined.
+ */
+static void
+reduce_all(const char *name, int reducer, PyArrayObject *arr,
+           PyArrayObject *out)
+{
+    const int type = PyArray_TYPE(arr);
+    const npy_intp isize = PyArray_ITEMSIZE(arr);
+    PyArrayIterObject *it;
+    float rf;
+    double rd, acc = 0;
+    int iaxis = -1, first = 1;
+    npy_intp n, sred;
+    NPY_BEGIN_THREADS_DEF;
+
+    if (PyArray_ISCARRAY_RO(arr) || PyArray_ISFARRAY_RO(arr)) {
+        NPY_BEGIN_THREADS;
+        reduce_run(type, name, reducer, PyArray_SIZE(arr), 1,
+                   PyArray_BYTES(arr), 1, 0, PyArray_BYTES(out));
+        NPY_END_THREADS;
+        return;
+    }
+    it = (PyArrayIterObject *)PyArray_IterAllButAxis((PyObject *)arr, &iaxis);
+    if (it == NULL) {
+        return;
+    }
+    n = PyArray_DIM(arr, iaxis);
+    sred = PyArray_STRIDE(arr, iaxis) / isize;
+    NPY_BEGIN_THREADS;
+    while (it->index < it->size) {
+        reduce_run(type, name, reducer, n, 1, it->dataptr, sred, 0,
+                   type == NPY_FLOAT ? (char *)&rf : (char *)&rd);
+        const double v = type == NPY_FLOAT ? rf : rd;
+        acc = first ? v : reduce_combine(reducer, acc, v);
+        first = 0;
+        PyArray_ITER_NEXT(it);
+    }
+    NPY_END_THREADS;
+    if (type == NPY_FLOAT) {
+        *(float *)PyArray_DATA(out) = (float)acc;
+    }
+    else {
+        *(double *)PyArray_DATA(out) = acc;
+    }
+    Py_DECREF(it);
+}
+
+static PyObject *
+reduce_map(PyObject *NPY_UNUSED(self), PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"func", "x", "reducer", "axis", NULL};
+    PyObject *func, *x, *axis_obj = Py_None;
+    const char *reducer_name = "sum";
+    const char *name;
+    PyArrayObject *arr, *tmp, *out;
+    int type, reducer, axis = 0, all_axes;
+    npy_intp n;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|sO:reduce_map", kwlist,
+                                     &func, &x, &reducer_name, &axis_obj)) {
+        return NULL;
+    }
+    if (PyObject_TypeCheck(func, &PyUFunc_Type)) {
+        name = ((PyUFuncObject *)func)->name;
+    }
+    else if (PyUnicode_Check(func)) {
+        name = PyUnicode_AsUTF8(func);
+        if (name == NULL) {
+            return NULL;
+        }
+    }
+    else {
+        PyErr_SetString(PyExc_TypeError,
+                "func must be a ufunc or the name of one");
+        return NULL;
+    }
+    if (reduce_run(NPY_DOUBLE, name, 0, 0, 0, NULL, 0, 0, NULL) < 0) {
+        PyErr_Format(PyExc_ValueError, "reduce_map does not support %s", name);
+        return NULL;
+    }
+    for (reducer = 0; reducer < NREDUCERS; reducer++) {
+        if (strcmp(reducer_names[reducer], reducer_name) == 0) {
+            break;
+        }
+    }
+    if (reducer == NREDUCERS) {
+        PyErr_Format(PyExc_ValueError,
+                "reducer must be 'sum', 'max', 'min' or 'maxabs', not '%s'",
+                reducer_name);
+        return NULL;
+    }
+    /* axis=None reduces all the elements */
+    all_axes = axis_obj == Py_None;
+    if (!all_axes) {
+        axis = PyArray_PyIntAsInt(axis_obj);
+        if (axis == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+    }
+
+    /* float16 and float32 inputs are reduced in float32, others in float64 */
+    tmp = (PyArrayObject *)PyArray_FROM_O(x);
+    if (tmp == NULL) {
+        return NULL;
+    }
+    type = PyArray_TYPE(tmp) == NPY_FLOAT || PyArray_TYPE(tmp) == NPY_HALF ?
+            NPY_FLOAT : NPY_DOUBLE;
+    arr = (PyArrayObject *)PyArray_FromAny((PyObject *)tmp,
+            PyArray_DescrFromType(type), 0, 0, NPY_ARRAY_ALIGNED, NULL);
+    Py_DECREF(tmp);
+    if (arr == NULL) {
+        return NULL;
+    }
+
+    if (all_axes) {
+        n = PyArray_SIZE(arr);
+        out = (PyArrayObject *)PyArray_SimpleNew(0, NULL, type);
+    }
+    else {
+        if (PyArray_NDIM(arr) > 2) {
+            PyErr_SetString(PyExc_ValueError,
+                    "reduce_map supports an axis for 1-D and 2-D inputs only");
+            Py_DECREF(arr);
+            return NULL;
+        }
+        tmp = (PyArrayObject *)PyArray_CheckAxis(arr, &axis, 0);
+        Py_DECREF(arr);
+        if (tmp == NULL) {
+            return NULL;
+        }
+        arr = tmp;
+        n = PyArray_DIM(arr, axis);
+        if (PyArray_NDIM(arr) == 1) {
+            out = (PyArrayObject *)PyArray_SimpleNew(0, NULL, type);
+        }
+        else {
+            out = (PyArrayObject *)PyArray_SimpleNew(1,
+                    PyArray_DIMS(arr) + (1 - axis), type);
+        }
+    }
+    if (out == NULL) {
+        Py_DECREF(arr);
+        return NULL;
+    }
+    if (n == 0 && reducer != MKL_UMATH_REDUCE_SUM) {
+        PyErr_Format(PyExc_ValueError,
+                "zero-size array to reduction operation %s which has no "
+                "identity", reducer_names[reducer]);
+        goto fail;
+    }
+
+    if (all_axes || PyArray_NDIM(arr) == 1) {
+        reduce_all(name, reducer, arr, out);
+        if (PyErr_Occurred()) {
+            goto fail;
+        }
+    }
+    else {
+        const npy_intp isize = PyArray_ITEMSIZE(arr);
+        NPY_BEGIN_THREADS_DEF;
+
+        NPY_BEGIN_THREADS;
+        reduce_run(type, name, reducer, n, PyArray_DIM(arr, 1 - axis),
+                   PyArray_BYTES(arr), PyArray_STRIDE(arr, axis) / isize,
+                   PyArray_STRIDE(arr, 1 - axis) / isize, PyArray_BYTES(out));
+        NPY_END_THREADS;
+    }
+    Py_DECREF(arr);
+    return PyArray_Return(out);
+
+fail:
+    Py_DECREF(arr);
+    Py_DECREF(out);
+    return NULL;
+}
+
+static PyMethodDef _ufuncs_methods[] = {
+    {"set_streaming_threshold", set_streaming_threshold, METH_O,
+     "set_streaming_threshold(nbytes)\n\n"
+     "Sets the size in bytes of a contiguous output above which the loops\n"
+     "write it with non-temporal stores, 0 disables them. The initial value\n"
+     "is read from the MKL_UMATH_STREAMING_THRESHOLD environment variable."},
+    {"get_streaming_threshold", get_streaming_threshold, METH_NOARGS,
+     "get_streaming_threshold()\n\n"
+     "Returns the size in bytes of a contiguous output above which the\n"
+     "loops write it with non-temporal stores."},
+    {"set_prefetch_distance", set_prefetch_distance, METH_O,
+     "set_prefetch_distance(distance)\n\n"
+     "Sets the distance in vectors at which the loops prefetch their\n"
+     "operands when software prefetch is enabled, at most 4096. The initial\n"
+     "value is read from the MKL_UMATH_PREFETCH_DISTANCE environment\n"
+     "variable."},
+    {"get_prefetch_distance", get_prefetch_distance, METH_NOARGS,
+     "get_prefetch_distance()\n\n"
+     "Returns the distance in vectors of the software prefetch."},
+    {"set_prefetch_enabled", set_prefetch_enabled, METH_O,
+     "set_prefetch_enabled(enabled)\n\n"
+     "Enables or disables the software prefetch of the loops, which is\n"
+     "disabled unless the MKL_UMATH_PREFETCH environment variable is set\n"
+     "to a non-zero value."},
+    {"get_prefetch_enabled", get_prefetch_enabled, METH_NOARGS,
+     "get_prefetch_enabled()\n\n"
+     "Returns whether the loops issue software prefetches."},
+    {"set_refinement_steps", set_refinement_steps, METH_O,
+     "set_refinement_steps(steps)\n\n"
+     "Sets the number of Newton-Raphson steps, 0 to 2, refining the\n"
+     "hardware estimates of rsqrt and recip, or None to compute them\n"
+     "with a full precision division. The initial value is read from the\n"
+     "MKL_UMATH_REFINEMENT_STEPS environment variable, None if unset."},
+    {"get_refinement_steps", get_refinement_steps, METH_NOARGS,
+     "get_refinement_steps()\n\n"
+     "Returns the number of Newton-Raphson steps refining the estimates of\n"
+     "rsqrt and recip, None for a full precision division."},
+    {"reduce_map", (PyCFunction)(void (*)(void))reduce_map,
+     METH_VARARGS | METH_KEYWORDS,
+     "reduce_map(func, x, reducer='sum', axis=None)\n\n"
+     "Reduces the results of the unary ufunc `func`, or its name, on `x`\n"
+     "without storing them: 'sum', 'max', 'min' or 'maxabs' (the maximum\n"
+     "absolute value), over all the elements or along `axis` of a 1-D or\n"
+     "2-D `x`. float16 and float32 inputs are reduced in float32, the\n"
+     "others are converted to float64. The sums are blocked like NumPy's\n"
+     "pairwise sums. Floating point errors are not reported."},
+    {NULL, NULL, 0, NULL}
+};
+
 /* now we initialize the Python module which contains our new object: */
 static PyModuleDef _ufuncs_module = {
     PyModuleDef_HEAD_INIT,
     "_ufuncs",
     "",
     -1,
-    NULL, NULL, NULL, NULL, NULL
+    _ufuncs_methods, NULL, NULL, NULL, NULL
 };
 
+/* reads the initial values of the tunables from the environment */
+static int
+init_tunables(void)
+{
+    npy_intp nbytes = mkl_umath_get_streaming_threshold();
+    npy_intp nvec = mkl_umath_get_prefetch_distance();
+    npy_intp enabled = mkl_umath_get_prefetch_enabled();
+    npy_intp steps = mkl_umath_get_refinement_steps();
+
+    if (getenv_intp("MKL_UMATH_STREAMING_THRESHOLD", &nbytes) < 0 ||
+            getenv_intp("MKL_UMATH_PREFETCH_DISTANCE", &nvec) < 0 ||
+            getenv_intp("MKL_UMATH_PREFETCH", &enabled) < 0 ||
+            getenv_intp("MKL_UMATH_REFINEMENT_STEPS", &steps) < 0) {
+        return -1;
+    }
+    if (nvec > MKL_UMATH_MAX_PREFETCH_DISTANCE) {
+        if (PyErr_WarnFormat(PyExc_RuntimeWarning, 1,
+                "ignoring MKL_UMATH_PREFETCH_DISTANCE=%zd, expected at most %d",
+                nvec, MKL_UMATH_MAX_PREFETCH_DISTANCE) < 0) {
+            return -1;
+        }
+        nvec = mkl_umath_get_prefetch_distance();
+    }
+    if (steps > 2) {
+        if (PyErr_WarnFormat(PyExc_RuntimeWarning, 1,
+                "ignoring MKL_UMATH_REFINEMENT_STEPS=%zd, expected 0, 1 or 2",
+                steps) < 0) {
+            return -1;
+        }
+        steps = mkl_umath_get_refinement_steps();
+    }
+    mkl_umath_set_streaming_threshold(nbytes);
+    mkl_umath_set_prefetch_distance(nvec);
+    mkl_umath_set_prefetch_enabled(enabled != 0);
+    mkl_umath_set_refinement_steps((int)steps);
+    return 0;
+}
+
 PyMODINIT_FUNC
 PyInit__ufuncs(void)
 {
@@ -61,6 +489,11 @@ PyInit__ufuncs(void)
 	return NULL;
     }
 
+    if (init_tunables() < 0) {
+	Py_XDECREF(m);
+	return NULL;
+    }
+
     return m;
 }
 
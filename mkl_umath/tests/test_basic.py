@@ -24,7 +24,9 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import math
 import numpy as np
+import pytest
 import mkl_umath._ufuncs as mu
 import numpy.core.umath as nu
 
@@ -36,7 +38,9 @@ num = 257
 def get_args(args_str):
     args = []
     for s in args_str:
-        if s == 'f':
+        if s == 'e':
+            args.append(np.half(np.random.random_sample(num)))
+        elif s == 'f':
             args.append(np.single(np.random.random_sample(num)))
         elif s == 'd':
             args.append(np.double(np.random.random_sample(num)))
@@ -44,15 +48,58 @@ def get_args(args_str):
             args.append(np.single(np.random.random_sample(num)) + np.single(np.random.random_sample(num)) * 1j)
         elif s == 'D':
             args.append(np.double(np.random.random_sample(num)) + np.double(np.random.random_sample(num)) * 1j)
-        elif s == 'i':
-            args.append(np.int(np.random.randint(num, low=1, high=10)))
-        elif s == 'l':
-            args.append(np.long(np.random.randint(num, low=1, high=10)))
+        elif s in 'ilq':
+            args.append(np.random.randint(1, 10, num).astype(s))
         else:
             raise ValueError("Unexpected type specified!")
     return tuple(args)
 
-def test():
+def from_math(f):
+    """Evaluates the scalar function `f` of the math module element-wise."""
+    vf = np.vectorize(f, otypes=[np.double])
+    return lambda x: vf(x).astype(np.result_type(x, np.single))
+
+def expit(x):
+    e = math.exp(-abs(x))
+    return (e if x < 0 else 1.0) / (1 + e)
+
+# references for the ufuncs that NumPy does not have
+references = {
+    'sincos': lambda x: (nu.sin(x), nu.cos(x)),
+    'erf': from_math(math.erf),
+    'erfc': from_math(math.erfc),
+    'tgamma': from_math(math.gamma),
+    'lgamma': from_math(math.lgamma),
+    'sinpi': from_math(lambda x: math.sin(math.pi * math.remainder(x, 2))),
+    'cospi': from_math(lambda x: math.cos(math.pi * math.remainder(x, 2))),
+    'exp10': from_math(lambda x: 10.0 ** x),
+    'sind': from_math(lambda x: math.sin(math.radians(math.fmod(x, 360)))),
+    'cosd': from_math(lambda x: math.cos(math.radians(math.fmod(x, 360)))),
+    'tand': from_math(lambda x: math.tan(math.radians(math.fmod(x, 360)))),
+    'arcsind': from_math(lambda x: math.degrees(math.asin(x))),
+    'arccosd': from_math(lambda x: math.degrees(math.acos(x))),
+    'arctand': from_math(lambda x: math.degrees(math.atan(x))),
+    'fma': lambda a, b, c: a * b + c,
+    'rsqrt': lambda x: 1 / nu.sqrt(x),
+    'recip': nu.reciprocal,
+    'expit': from_math(expit),
+    'softplus': from_math(lambda x: max(x, 0) + math.log1p(math.exp(-abs(x)))),
+    'gelu': from_math(lambda x: x / 2 * math.erfc(-x / math.sqrt(2))),
+    'gelu_tanh': from_math(lambda x: x * expit(
+        2 * math.sqrt(2 / math.pi) * (x + 0.044715 * x**3))),
+    'silu': from_math(lambda x: x * expit(x)),
+}
+
+def reference(umath):
+    return references[umath] if umath in references else getattr(nu, umath)
+
+def allclose(actual, desired):
+    # float16 results are rounded from float32 ones, which may differ from
+    # NumPy's by an ulp and round to neighbouring halves
+    rtol = 2e-3 if np.asarray(desired).dtype == np.half else 1e-5
+    return np.allclose(actual, desired, rtol=rtol)
+
+def get_test_cases():
     umaths = [i for i in dir(mu) if isinstance(getattr(mu, i), np.ufunc)]
 
     umaths.remove('arccosh') # expects input greater than 1
@@ -69,20 +116,34 @@ def test():
             generated_cases[(umath, type)] = args
 
     additional_cases = {
+        ('arccosh', 'e->e') : (np.half(np.random.random_sample(num) + 1),),
         ('arccosh', 'f->f') : (np.single(np.random.random_sample(num) + 1),),
         ('arccosh', 'd->d') : (np.double(np.random.random_sample(num) + 1),),
+        ('arccosh', 'f->d') : (np.single(np.random.random_sample(num) + 1),),
+        ('arccosh', 'd->f') : (np.double(np.random.random_sample(num) + 1),),
     }
 
+    # integers inside the domains of the inverse functions
+    for type in ('i->d', 'l->d', 'q->d', 'i->f'):
+        for umath in ('arcsin', 'arccos', 'arctanh'):
+            additional_cases[(umath, type)] = (
+                np.random.randint(-1, 2, num).astype(type[0]),)
+        additional_cases[('arccosh', type)] = get_args(type[0])
+
     test_cases = {}
     for d in (generated_cases, additional_cases):
         test_cases.update(d)
+    return test_cases
+
+def test():
+    test_cases = get_test_cases()
 
     for case in test_cases:
         umath = case[0]
         type = case[1]
         args = test_cases[case]
         mkl_umath = getattr(mu, umath)
-        np_umath = getattr(nu, umath)
+        np_umath = reference(umath)
 #        print('*'*80)
 #        print(umath, type)
 #        print("args", args)
@@ -91,4 +152,609 @@ def test():
 #        print("mkl res", mkl_res)
 #        print("npy res", np_res)
 
-        assert np.allclose(mkl_res, np_res)
+        assert allclose(mkl_res, np_res)
+
+def as_strided_view(a, stride):
+    """Returns a view of a copy of `a` whose elements are `stride` apart."""
+    if stride == 1:
+        return a.copy()
+    base = np.zeros(a.shape[0] * abs(stride), dtype=a.dtype)
+    view = base[::stride]
+    view[...] = a
+    return view
+
+# (input stride, output stride) in elements
+layouts = [(2, 2), (3, 3), (8, 8), (64, 64), (1, 3), (3, 1),
+           (-1, 1), (1, -1), (-1, -1), (-2, 1), (1, -3)]
+
+def test_strided():
+    test_cases = get_test_cases()
+
+    for case in test_cases:
+        umath = case[0]
+        args = test_cases[case]
+        mkl_umath = getattr(mu, umath)
+        if mkl_umath.nout != 1:
+            continue
+        np_umath = reference(umath)
+        np_res = np_umath(*args)
+        for in_stride, out_stride in layouts:
+            strided_args = tuple(as_strided_view(a, in_stride) for a in args)
+            out = as_strided_view(np.empty_like(np_res), out_stride)
+            mkl_res = mkl_umath(*strided_args, out=out)
+
+            assert allclose(mkl_res, np_res), (case, in_stride, out_stride)
+
+def test_column():
+    for dtype in (np.single, np.double):
+        a = dtype(np.random.random_sample((num, 5)))
+        out = np.empty((num, 5), dtype=dtype)
+        mu.exp(a[:, 2], out=out[:, 3])
+
+        assert allclose(out[:, 3], nu.exp(a[:, 2]))
+
+        # strided input into a fresh contiguous output and vice versa
+        assert allclose(mu.log(a[:, 1]), nu.log(a[:, 1]))
+        x = dtype(np.random.random_sample(num))
+        mu.sin(x, out=out[:, 0])
+
+        assert allclose(out[:, 0], nu.sin(x))
+
+def test_overlap():
+    test_cases = get_test_cases()
+
+    for case in test_cases:
+        umath = case[0]
+        args = test_cases[case]
+        if len(args) != 1:
+            continue
+        mkl_umath = getattr(mu, umath)
+        if mkl_umath.nout != 1:
+            continue
+        # the output can only alias an input of its own type
+        if case[1][0] != case[1][-1]:
+            continue
+        np_umath = reference(umath)
+        for shift in (1, 3, 17, 100):
+            a = np.concatenate((args[0], args[0][:shift]))
+
+            # forward: the output trails the input
+            b = a.copy()
+            mkl_umath(b[shift:], out=b[:-shift])
+            assert allclose(b[:-shift], np_umath(a[shift:])), (case, shift)
+
+            # backward: the output runs ahead of the input
+            b = a.copy()
+            mkl_umath(b[:-shift], out=b[shift:])
+            assert allclose(b[shift:], np_umath(a[:-shift])), (case, shift)
+
+        # reversed view of the output
+        b = args[0].copy()
+        mkl_umath(b[::-1], out=b)
+        assert allclose(b, np_umath(args[0][::-1])), case
+
+# lengths around multiples of the vector lengths of the unrolled kernels
+lengths = list(range(70)) + [127, 128, 129, 255, 256, 1023, 1024, 1025]
+
+def test_lengths():
+    test_cases = get_test_cases()
+
+    for case in test_cases:
+        umath = case[0]
+        args = test_cases[case]
+        mkl_umath = getattr(mu, umath)
+        np_umath = reference(umath)
+        for n in lengths:
+            nargs = tuple(np.resize(a, n) for a in args)
+
+            assert allclose(mkl_umath(*nargs), np_umath(*nargs)), (case, n)
+
+def test_broadcast():
+    test_cases = get_test_cases()
+
+    for case in test_cases:
+        umath = case[0]
+        args = test_cases[case]
+        if len(args) != 1:
+            continue
+        mkl_umath = getattr(mu, umath)
+        if mkl_umath.nout != 1:
+            continue
+        np_umath = reference(umath)
+        x = args[0][:1]
+        expected = np_umath(x)
+        for out_stride in (1, 3, -1):
+            out = as_strided_view(np.empty(num, dtype=expected.dtype), out_stride)
+            mkl_umath(np.broadcast_to(x, (num,)), out=out)
+            assert allclose(out, expected[0]), (case, out_stride)
+
+            out = as_strided_view(np.empty(num, dtype=expected.dtype), out_stride)
+            mkl_umath(x[0], out=out)
+            assert allclose(out, expected[0]), (case, out_stride)
+
+def test_binary_layouts():
+    test_cases = get_test_cases()
+
+    for case in test_cases:
+        umath = case[0]
+        args = test_cases[case]
+        if len(args) != 2:
+            continue
+        mkl_umath = getattr(mu, umath)
+        np_umath = reference(umath)
+        x, y = args
+        layouts = [
+            (x, y),                  # contiguous
+            (x[0], y),               # scalar first
+            (x, y[0]),               # scalar second
+            (x[::2], y[::2]),        # strided
+            (x[::-1], y),            # reversed
+        ]
+        for a, b in layouts:
+            assert allclose(mkl_umath(a, b), np_umath(a, b)), case
+
+        # in place on either input
+        expected = np_umath(x, y)
+        a, b = x.copy(), y.copy()
+        mkl_umath(a, b, out=a)
+        assert allclose(a, expected), case
+        a, b = x.copy(), y.copy()
+        mkl_umath(a, b, out=b)
+        assert allclose(b, expected), case
+
+def test_logaddexp_special():
+    inf, nan = np.inf, np.nan
+    x = [inf, -inf, inf, -inf, 0.0, 1e30, -1e30, 1.0, 5.0]
+    y = [inf, -inf, -inf, 3.0, 0.0, 1e30, 1e30, 40.0, 5.0]
+    for dtype in (np.single, np.double):
+        a = np.resize(np.array(x, dtype=dtype), num)
+        b = np.resize(np.array(y, dtype=dtype), num)
+        for umath in ('logaddexp', 'logaddexp2'):
+            # infinities of the same sign raise no invalid flag
+            with np.errstate(invalid='raise'):
+                res = getattr(mu, umath)(a, b)
+            np.testing.assert_allclose(res, getattr(nu, umath)(a, b),
+                                       rtol=1e-6, err_msg=umath)
+            with np.errstate(invalid='ignore'):
+                assert np.isnan(getattr(mu, umath)(a, nan)).all()
+                assert np.isnan(getattr(mu, umath)(nan, b)).all()
+
+def test_sincos():
+    for dtype in (np.single, np.double):
+        x = dtype(np.random.uniform(-100, 100, num))
+        expected = (nu.sin(x), nu.cos(x))
+        for in_stride, out_stride in layouts + [(1, 1)]:
+            a = as_strided_view(x, in_stride)
+            s = as_strided_view(np.empty_like(x), out_stride)
+            c = as_strided_view(np.empty_like(x), out_stride)
+            res = mu.sincos(a, out=(s, c))
+            assert res[0] is s and res[1] is c
+            assert allclose(s, expected[0]), (in_stride, out_stride)
+            assert allclose(c, expected[1]), (in_stride, out_stride)
+
+        # in place on either output
+        s = x.copy()
+        c = np.empty_like(x)
+        mu.sincos(s, out=(s, c))
+        assert allclose(s, expected[0]) and allclose(c, expected[1])
+        c = x.copy()
+        mu.sincos(c, out=(s, c))
+        assert allclose(s, expected[0]) and allclose(c, expected[1])
+
+def fma_allclose(actual, a, b, c):
+    # relative to the terms, as their sum may cancel
+    size = np.abs(a * b) + np.abs(c)
+    return np.allclose(actual, a * b + c, rtol=0, atol=1e-5 * size)
+
+def test_fma():
+    for dtype in (np.single, np.double):
+        x, y, z = (dtype(np.random.uniform(-10, 10, num)) for _ in range(3))
+        a, b = dtype(3.5), dtype(-0.25)
+        # every combination of contiguous and broadcast scalar inputs
+        for args in [(x, y, z), (a, y, z), (x, a, z), (a, b, z), (x, y, b),
+                     (a, y, b), (x, a, b), (a, b, a),
+                     (np.broadcast_to(a, (num,)), y, np.broadcast_to(b, (num,))),
+                     (x[::2], y[::2], z[::2]), (x[::-1], a, z)]:
+            out = np.empty(np.broadcast(*args).shape, dtype=dtype)
+            assert mu.fma(*args, out=out) is out
+            assert fma_allclose(out, *args)
+
+        # affine transform of the rows of a 2-D array
+        m = x[:255].reshape(85, 3)
+        scale, offset = y[:3], z[:3]
+        assert fma_allclose(mu.fma(m, scale, offset), m, scale, offset)
+
+        # in place on each input
+        for i in range(3):
+            args = [x.copy(), y.copy(), z.copy()]
+            mu.fma(*args, out=args[i])
+            assert fma_allclose(args[i], x, y, z), i
+
+        # a single rounding: (1 + eps)(1 - eps) - 1 is -eps**2, not 0
+        eps = np.finfo(dtype).eps
+        res = mu.fma(np.full(num, 1 + eps, dtype=dtype), dtype(1 - eps), dtype(-1))
+        assert (res == -dtype(eps)**2).all()
+
+def test_complex_special():
+    inf, nan = np.inf, np.nan
+    values = [0.0, -0.0, 1.0, -1.0, 0.5, 1e-30, 1e30, 80.0, -200.0, inf, -inf, nan]
+    z = np.array([complex(re, im) for re in values for im in values])
+    # zero imaginary parts of either sign select the sides of the branch cuts
+    z = np.concatenate((z, [1 + 1e-9j, 1 - 1e-9j, 0.6 + 0.8j, -4 + 0j, -4 - 0j,
+                            1e-9 + 1j, 2j, -2j, 1.5 + 0j, -1.5 - 0j]))
+    # finite values only, so that whole vectors take the vector formulas
+    finite = [0.0, -0.0, 0.25, -0.5, 0.999, 1.001, -3.0, 20.0]
+    z = np.concatenate((z, [complex(re, im) for re in finite for im in finite]))
+    for dtype in (np.csingle, np.cdouble):
+        x = np.resize(z.astype(dtype), num)
+        for umath in ('exp', 'log', 'log10', 'log2', 'sqrt', 'sin', 'cos',
+                      'tan', 'sinh', 'cosh', 'tanh', 'arcsin', 'arccos',
+                      'arctan', 'arcsinh', 'arccosh', 'arctanh'):
+            with np.errstate(all='ignore'):
+                res = getattr(mu, umath)(x)
+                expected = getattr(nu, umath)(x)
+            np.testing.assert_allclose(res, expected, rtol=1e-5,
+                                       equal_nan=True, err_msg=umath)
+            assert (np.signbit(res.imag) == np.signbit(expected.imag)).all(), umath
+
+def test_mixed_precision():
+    test_cases = get_test_cases()
+
+    for case in test_cases:
+        umath, type = case
+        if type not in ('f->d', 'd->f'):
+            continue
+        x = test_cases[case][0]
+        dtype = np.dtype(type[-1])
+        mkl_umath = getattr(mu, umath)
+        # the kernels compute in double precision
+        expected = getattr(nu, umath)(np.double(x)).astype(dtype)
+
+        res = mkl_umath(x, dtype=dtype)
+        assert res.dtype == dtype
+        assert allclose(res, expected), case
+        for in_stride, out_stride in layouts:
+            a = as_strided_view(x, in_stride)
+            out = as_strided_view(np.empty(num, dtype=dtype), out_stride)
+            res = mkl_umath(a, out=out, dtype=dtype)
+            assert res is out
+            assert allclose(out, expected), (case, in_stride, out_stride)
+
+def test_integer_input():
+    for type in ('i->d', 'l->d', 'q->d', 'i->f'):
+        x = np.random.randint(-2**20, 2**20, num).astype(type[0])
+        dtype = np.dtype(type[-1])
+        for umath in ('sin', 'exp2', 'cbrt'):
+            mkl_umath = getattr(mu, umath)
+            expected = getattr(nu, umath)(x.astype(dtype))
+            # i->f is only picked for an explicit float32 output
+            res = mkl_umath(x, dtype=dtype) if dtype == np.single else mkl_umath(x)
+            assert res.dtype == dtype
+            assert allclose(res, expected), (umath, type)
+            for in_stride, out_stride in layouts:
+                a = as_strided_view(x, in_stride)
+                out = as_strided_view(np.empty(num, dtype=dtype), out_stride)
+                mkl_umath(a, out=out, dtype=dtype)
+                assert allclose(out, expected), (umath, type, in_stride, out_stride)
+
+def test_special_functions():
+    inf, nan = np.inf, np.nan
+    x = [0.5, -0.5, 1.0, 2.0, 3.5, -2.5, 10.0, -10.5, 30.0, 170.5, 200.0,
+         inf, -inf, nan]
+
+    def expected(f, v):
+        try:
+            return f(v)
+        except OverflowError:
+            return inf
+        except ValueError:
+            return nan
+
+    for dtype in (np.single, np.double):
+        a = np.resize(np.array(x, dtype=dtype), num)
+        for umath, f in (('erf', math.erf), ('erfc', math.erfc),
+                         ('tgamma', math.gamma), ('lgamma', math.lgamma)):
+            with np.errstate(all='ignore'):
+                res = getattr(mu, umath)(a)
+                desired = np.array([expected(f, v) for v in a]).astype(dtype)
+            assert res.dtype == dtype
+            np.testing.assert_allclose(res, desired, rtol=1e-5, atol=1e-8,
+                                       equal_nan=True, err_msg=umath)
+
+def test_pi_functions():
+    inf, nan = np.inf, np.nan
+    h = math.sqrt(0.5)
+    # (x, sinpi(x), cospi(x)), beyond 8e6 as well where SLEEF's own
+    # reduction gives up
+    values = [(0.0, 0.0, 1.0), (0.25, h, h), (0.5, 1.0, 0.0), (1.0, 0.0, -1.0),
+              (1.5, -1.0, 0.0), (-0.5, -1.0, 0.0), (-1.25, h, -h),
+              (3.0, 0.0, -1.0), (8100000.5, 1.0, 0.0), (8100001.0, 0.0, -1.0),
+              (inf, nan, nan), (-inf, nan, nan), (nan, nan, nan)]
+    double_values = [(3e8 + 0.5, 1.0, 0.0), (1e15 + 1.5, -1.0, 0.0),
+                     (2.0**60, 0.0, 1.0)]
+    for dtype in (np.single, np.double):
+        v = values + double_values if dtype == np.double else values
+        x, s, c = (np.resize(np.array(a, dtype=dtype), num) for a in zip(*v))
+        with np.errstate(invalid='ignore'):
+            for umath, desired in (('sinpi', s), ('cospi', c)):
+                res = getattr(mu, umath)(x)
+                assert res.dtype == dtype
+                np.testing.assert_allclose(res, desired, rtol=1e-6, atol=1e-7,
+                                           equal_nan=True, err_msg=umath)
+        # sinpi is odd
+        assert np.signbit(mu.sinpi(np.array([-0.0, -2.0], dtype=dtype))).all()
+
+        x = np.array([0.0, 1.0, -2.0, 5.5, 30.0, -inf, inf, nan], dtype=dtype)
+        with np.errstate(over='ignore'):
+            desired = np.power(10.0, x.astype(np.double)).astype(dtype)
+        np.testing.assert_allclose(mu.exp10(x), desired, rtol=1e-6,
+                                   equal_nan=True)
+
+def test_degrees():
+    inf, nan = np.inf, np.nan
+    h = math.sqrt(0.5)
+    # (x, sind(x), cosd(x), tand(x)), exact at the multiples of 90 degrees
+    # also beyond the range of the fast reduction
+    values = [(0.0, 0.0, 1.0, 0.0), (45.0, h, h, 1.0), (90.0, 1.0, 0.0, inf),
+              (-90.0, -1.0, 0.0, -inf), (180.0, 0.0, -1.0, 0.0),
+              (270.0, -1.0, 0.0, -inf), (-135.0, -h, -h, 1.0),
+              (720.0 + 30, 0.5, math.sqrt(0.75), math.sqrt(1/3)),
+              (360.0 * 2**14, 0.0, 1.0, 0.0), (90.0 + 360 * 2**14, 1.0, 0.0, inf),
+              (inf, nan, nan, nan), (-inf, nan, nan, nan), (nan, nan, nan, nan)]
+    double_values = [(90.0 + 360 * 2**40, 1.0, 0.0, inf),
+                     (360.0 * 2**60, 0.0, 1.0, 0.0)]
+    for dtype in (np.single, np.double):
+        v = values + double_values if dtype == np.double else values
+        x, s, c, t = (np.resize(np.array(a, dtype=dtype), num) for a in zip(*v))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for umath, desired in (('sind', s), ('cosd', c), ('tand', t)):
+                res = getattr(mu, umath)(x)
+                assert res.dtype == dtype
+                np.testing.assert_allclose(res, desired, rtol=1e-6, atol=0,
+                                           equal_nan=True, err_msg=umath)
+
+        x = np.array([-1.0, -h, -0.5, 0.0, 0.5, h, 1.0, inf, -inf], dtype=dtype)
+        with np.errstate(invalid='ignore'):
+            for umath, desired in (
+                    ('arcsind', [-90, -45, -30, 0, 30, 45, 90, nan, nan]),
+                    ('arccosd', [180, 135, 120, 90, 60, 45, 0, nan, nan]),
+                    ('arctand', [-45, -35.26438968, -26.56505118, 0,
+                                 26.56505118, 35.26438968, 45, 90, -90])):
+                res = getattr(mu, umath)(x)
+                np.testing.assert_allclose(res, desired, rtol=1e-6,
+                                           equal_nan=True, err_msg=umath)
+
+def test_activations():
+    inf, nan = np.inf, np.nan
+    for dtype in (np.single, np.double):
+        x = np.linspace(-5, 5, 1001, dtype=dtype)
+        rtol = 1e-5 if dtype == np.single else 1e-12
+        for umath in ('expit', 'softplus', 'gelu', 'gelu_tanh', 'silu'):
+            np.testing.assert_allclose(getattr(mu, umath)(x),
+                                       reference(umath)(x), rtol=rtol,
+                                       atol=0, err_msg=umath)
+
+        # no intermediate overflows, and -0 rather than -inf*0 = NaN
+        big = np.finfo(dtype).max
+        ln2 = math.log(2)
+        x = np.resize(np.array([-inf, inf, nan, -0.0, 0.0, -big, big, -1e3],
+                               dtype=dtype), num)
+        with np.errstate(over='raise', invalid='raise', divide='raise'):
+            for umath, desired in (
+                    ('expit', [0, 1, nan, 0.5, 0.5, 0, 1, 0]),
+                    ('softplus', [0, inf, nan, ln2, ln2, 0, big, 0]),
+                    ('gelu', [-0.0, inf, nan, -0.0, 0, -0.0, big, -0.0]),
+                    ('gelu_tanh', [-0.0, inf, nan, -0.0, 0, -0.0, big, -0.0]),
+                    ('silu', [-0.0, inf, nan, -0.0, 0, -0.0, big, -0.0])):
+                res = getattr(mu, umath)(x)
+                desired = np.resize(np.array(desired, dtype=dtype), num)
+                assert res.dtype == dtype
+                np.testing.assert_allclose(res, desired, rtol=1e-6,
+                                           equal_nan=True, err_msg=umath)
+                notnan = ~np.isnan(desired)
+                assert np.array_equal(np.signbit(res[notnan]),
+                                      np.signbit(desired[notnan])), umath
+
+def test_half_special():
+    inf, nan = np.inf, np.nan
+    # results beyond the float16 range round to infinity on the store
+    x = np.resize(np.array([0.0, -0.0, inf, -inf, nan, 12.0, -12.0, 65504.0,
+                            6e-8, -1.0, 2.0], dtype=np.half), num)
+    for umath in ('exp', 'exp2', 'expm1', 'log', 'log1p', 'sqrt', 'sinh',
+                  'cosh', 'tanh', 'arcsinh', 'cbrt'):
+        with np.errstate(all='ignore'):
+            res = getattr(mu, umath)(x)
+            expected = getattr(nu, umath)(x)
+        assert res.dtype == np.half
+        np.testing.assert_allclose(res, expected, rtol=2e-3, equal_nan=True,
+                                   err_msg=umath)
+
+def test_misaligned():
+    # long enough for the kernels that peel the input to vector alignment
+    n = 8192
+    test_cases = get_test_cases()
+
+    for case in test_cases:
+        umath = case[0]
+        args = test_cases[case]
+        if len(args) != 1:
+            continue
+        mkl_umath = getattr(mu, umath)
+        np_umath = reference(umath)
+        a = np.resize(args[0], n + 8)
+        for offset in range(8):
+            x = a[offset:offset + n]
+
+            assert allclose(mkl_umath(x), np_umath(x)), (case, offset)
+
+def test_streaming_threshold():
+    old = mu.get_streaming_threshold()
+    try:
+        mu.set_streaming_threshold(1)
+        assert mu.get_streaming_threshold() == 1
+
+        # every contiguous output is now written with non-temporal stores
+        test_cases = get_test_cases()
+        for case in test_cases:
+            umath = case[0]
+            args = test_cases[case]
+            mkl_umath = getattr(mu, umath)
+            np_umath = reference(umath)
+            for n in (1, 15, 257, 4099):
+                nargs = tuple(np.resize(a, n) for a in args)
+                assert allclose(mkl_umath(*nargs), np_umath(*nargs)), (case, n)
+
+        mu.set_streaming_threshold(0)
+        assert mu.get_streaming_threshold() == 0
+        with pytest.raises(ValueError):
+            mu.set_streaming_threshold(-1)
+        with pytest.raises(TypeError):
+            mu.set_streaming_threshold(1.5)
+    finally:
+        mu.set_streaming_threshold(old)
+
+
+def test_prefetch():
+    old = mu.get_prefetch_enabled(), mu.get_prefetch_distance()
+    try:
+        mu.set_prefetch_enabled(True)
+        assert mu.get_prefetch_enabled() is True
+        test_cases = get_test_cases()
+        for distance in (0, 1, 64, 4096):
+            mu.set_prefetch_distance(distance)
+            assert mu.get_prefetch_distance() == distance
+            # prefetching past the end of the operands must not fault
+            for case in test_cases:
+                umath = case[0]
+                args = test_cases[case]
+                if len(args) != 1:
+                    continue
+                mkl_umath = getattr(mu, umath)
+                np_umath = reference(umath)
+                for stride in (1, -1, 3):
+                    a = args[0][::stride]
+                    assert allclose(mkl_umath(a), np_umath(a)), (case, distance, stride)
+
+        mu.set_prefetch_enabled(False)
+        assert mu.get_prefetch_enabled() is False
+        with pytest.raises(ValueError):
+            mu.set_prefetch_distance(-1)
+        with pytest.raises(ValueError):
+            mu.set_prefetch_distance(4097)
+        with pytest.raises(TypeError):
+            mu.set_prefetch_distance(1.5)
+    finally:
+        mu.set_prefetch_enabled(old[0])
+        mu.set_prefetch_distance(old[1])
+
+def test_refinement_steps():
+    old = mu.get_refinement_steps()
+    inf, nan = np.inf, np.nan
+    rng = np.random.default_rng(7)
+    try:
+        for steps, bits in ((0, 7), (1, 13), (2, 26), (None, None)):
+            mu.set_refinement_steps(steps)
+            assert mu.get_refinement_steps() == steps
+            for dtype in (np.single, np.double):
+                eps = np.finfo(dtype).eps
+                rtol = 2 * eps if bits is None else max(2.0**-bits, 4 * eps)
+                x = (10 ** rng.uniform(-30, 30, 1000)).astype(dtype)
+                for stride in (1, -1, 3):
+                    a = x[::stride]
+                    np.testing.assert_allclose(mu.rsqrt(a), 1 / np.sqrt(a),
+                                               rtol=rtol, err_msg=str(steps))
+                    np.testing.assert_allclose(mu.recip(-a), -1 / a,
+                                               rtol=rtol, err_msg=str(steps))
+                    # the loops patched into NumPy always divide
+                    np.testing.assert_array_equal(mu.reciprocal(a), 1 / a)
+
+                # the specials are exact and raise no spurious flags
+                x = np.resize(np.array([0.0, -0.0, inf, -inf, nan, 1.0],
+                                       dtype=dtype), num)
+                with np.errstate(divide='ignore'):
+                    res = mu.recip(x)
+                assert np.array_equal(np.signbit(res[:4]), [False, True, False, True])
+                np.testing.assert_array_equal(res, 1 / x)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    res = mu.rsqrt(x)
+                    desired = 1 / np.sqrt(x)
+                np.testing.assert_array_equal(res, desired)
+                with np.errstate(all='raise'):
+                    mu.rsqrt(x[2:3])
+                    mu.recip(x[2:4])
+
+        with pytest.raises(ValueError):
+            mu.set_refinement_steps(3)
+        with pytest.raises(ValueError):
+            mu.set_refinement_steps(-1)
+        with pytest.raises(TypeError):
+            mu.set_refinement_steps(1.5)
+    finally:
+        mu.set_refinement_steps(old)
+
+    # integers are converted to float64, not divided as integers
+    res = mu.reciprocal(np.array([1, 2, 4]))
+    assert res.dtype == np.double
+    np.testing.assert_array_equal(res, [1.0, 0.5, 0.25])
+
+def test_reduce_map():
+    rng = np.random.default_rng(11)
+    reducers = {'sum': np.sum, 'max': np.max, 'min': np.min,
+                'maxabs': lambda a, axis=None: np.abs(a).max(axis=axis)}
+    for dtype in (np.single, np.double):
+        rtol = 1e-5 if dtype == np.single else 1e-12
+        x = rng.uniform(0.5, 2.0, 100003).astype(dtype)
+        # lengths around the vectors and blocks of the sums, and strides
+        for a in (x, x[:1], x[:17], x[:1031], x[::3], x[::-1], x[::4099]):
+            for umath in ('exp', 'log', 'sin', 'expit'):
+                mapped = getattr(mu, umath)(a)
+                for reducer, f in reducers.items():
+                    res = mu.reduce_map(umath, a, reducer)
+                    assert res.dtype == dtype
+                    np.testing.assert_allclose(res, f(mapped.astype(np.double)),
+                                               rtol=rtol, err_msg=(umath, reducer))
+
+        # C and F ordered, and non-contiguous 2-D inputs
+        x2 = rng.uniform(-3.0, 3.0, (67, 45)).astype(dtype)
+        for a in (x2, np.asfortranarray(x2), x2[::2, 1::3], x2[:1], x2[:, :1]):
+            mapped = mu.sin(a).astype(np.double)
+            for reducer, f in reducers.items():
+                for axis in (None, 0, 1, -1, -2):
+                    res = mu.reduce_map(mu.sin, a, reducer, axis=axis)
+                    desired = f(mapped, axis=axis)
+                    assert res.shape == np.shape(desired)
+                    # the sums of sines cancel
+                    np.testing.assert_allclose(res, desired, rtol=rtol,
+                                               atol=rtol * np.abs(mapped).sum(),
+                                               err_msg=(reducer, axis))
+        a = rng.uniform(size=(4, 5, 6)).astype(dtype).transpose(2, 0, 1)[::2]
+        np.testing.assert_allclose(mu.reduce_map(np.exp, a),
+                                   np.exp(a.astype(np.double)).sum(), rtol=rtol)
+
+        # NaNs propagate through max and min like in NumPy
+        a = np.ones(300, dtype=dtype)
+        a[123] = np.nan
+        for reducer in reducers:
+            assert np.isnan(mu.reduce_map('sqrt', a, reducer))
+
+    assert mu.reduce_map('exp', np.arange(10)).dtype == np.double
+    assert mu.reduce_map('exp', np.ones(10, dtype=np.half)).dtype == np.single
+    assert mu.reduce_map('exp', np.zeros(0)) == 0
+    np.testing.assert_array_equal(
+        mu.reduce_map('exp', np.zeros((0, 3)), axis=0), np.zeros(3))
+    with pytest.raises(ValueError):
+        mu.reduce_map('exp', np.zeros(0), 'max')
+    with pytest.raises(ValueError):
+        mu.reduce_map('absolute', np.ones(3))
+    with pytest.raises(ValueError):
+        mu.reduce_map('exp', np.ones(3), 'prod')
+    with pytest.raises(ValueError):
+        mu.reduce_map('exp', np.ones((2, 2)), axis=2)
+    with pytest.raises(ValueError):
+        mu.reduce_map('exp', np.ones((2, 2)), axis=32)
+    with pytest.raises(ValueError):
+        mu.reduce_map('exp', np.ones((2, 2, 2)), axis=0)
+    with pytest.raises(TypeError):
+        mu.reduce_map(np.exp, np.ones(3, dtype=np.complex128))
+    with pytest.raises(TypeError):
+        mu.reduce_map(1, np.ones(3))
@@ -108,8 +108,9 @@ def add_newdoc(place, name, doc):
     skip = (
         # gufuncs do not use the OUT_SCALAR replacement strings
         'matmul',
-        # clip has 3 inputs, which is not handled by this
+        # clip and fma have 3 inputs, which is not handled by this
         'clip',
+        'fma',
     )
     if name[0] != '_' and name not in skip:
         if '\nx :' in doc:
@@ -4058,3 +4059,718 @@ add_newdoc('numpy.core.umath', 'lcm',
     array([ 0, 20, 20, 60, 20, 20])
 
     """)
+
+# ufuncs that NumPy does not provide
+
+add_newdoc('mkl_umath', 'sincos',
+    """
+    Sine and cosine element-wise, with a single argument reduction.
+
+    Parameters
+    ----------
+    x : array_like
+        Angle, in radians (:math:`2 \\pi` rad equals 360 degrees).
+    $PARAMS
+
+    Returns
+    -------
+    y1 : ndarray
+        The sine of each element of `x`.
+        $OUT_SCALAR_1
+    y2 : ndarray
+        The cosine of each element of `x`.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    sin, cos
+
+    Examples
+    --------
+    >>> s, c = mkl_umath.sincos(np.array([0., np.pi/2]))
+    >>> s
+    array([0., 1.])
+    >>> np.allclose(c, [1., 0.])
+    True
+    >>> x = np.linspace(0, np.pi, 5)
+    >>> s, c = np.empty_like(x), np.empty_like(x)
+    >>> _ = mkl_umath.sincos(x, out=(s, c))
+
+    """)
+
+add_newdoc('mkl_umath', 'erf',
+    """
+    Error function, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        :math:`\\frac{2}{\\sqrt{\\pi}} \\int_0^x e^{-t^2} dt` for each
+        element of `x`.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    erfc
+
+    Notes
+    -----
+    Gives the same results as `scipy.special.erf`.
+
+    Examples
+    --------
+    >>> mkl_umath.erf(np.array([0., 0.5, np.inf]))
+    array([0.        , 0.52049988, 1.        ])
+
+    """)
+
+add_newdoc('mkl_umath', 'erfc',
+    """
+    Complementary error function, ``1 - erf(x)``, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        The complementary error function of each element of `x`, which
+        keeps its relative accuracy for large `x` where ``1 - erf(x)``
+        underflows to 0.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    erf
+
+    Examples
+    --------
+    >>> mkl_umath.erfc(np.array([0., 10.]))
+    array([1.00000000e+00, 2.08848758e-45])
+
+    """)
+
+add_newdoc('mkl_umath', 'tgamma',
+    """
+    Gamma function, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        The gamma function of each element of `x`. It is `inf` at 0 and
+        beyond the overflow threshold, and `nan` at the negative integers.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    lgamma
+
+    Notes
+    -----
+    Gives the same results as `scipy.special.gamma` for real arguments.
+
+    Examples
+    --------
+    >>> mkl_umath.tgamma(np.array([0.5, 1., 5.]))
+    array([ 1.77245385,  1.        , 24.        ])
+
+    """)
+
+add_newdoc('mkl_umath', 'lgamma',
+    """
+    Natural logarithm of the absolute value of the gamma function,
+    element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        ``log(abs(tgamma(x)))`` for each element of `x`, which stays finite
+        long after the gamma function overflows.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    tgamma
+
+    Notes
+    -----
+    Gives the same results as `scipy.special.gammaln`.
+
+    Examples
+    --------
+    >>> mkl_umath.lgamma(np.array([1., 3., 100.]))
+    array([  0.        ,   0.69314718, 359.13420537])
+
+    """)
+
+add_newdoc('mkl_umath', 'sinpi',
+    """
+    Sine of pi times the argument, ``sin(pi*x)``, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Angle, in half-turns (1 equals 180 degrees).
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        The sine of ``pi*x``. The argument is reduced exactly, so that
+        the results are accurate for large `x` and exact at the integers
+        and half-integers.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    cospi, sin
+
+    Examples
+    --------
+    >>> mkl_umath.sinpi(np.array([0., 0.5, 1., 1e15 + 0.5]))
+    array([0., 1., 0., 1.])
+
+    """)
+
+add_newdoc('mkl_umath', 'cospi',
+    """
+    Cosine of pi times the argument, ``cos(pi*x)``, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Angle, in half-turns (1 equals 180 degrees).
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        The cosine of ``pi*x``. The argument is reduced exactly, so that
+        the results are accurate for large `x` and exact at the integers
+        and half-integers.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    sinpi, cos
+
+    Examples
+    --------
+    >>> mkl_umath.cospi(np.array([0., 0.5, 1., 1e15 + 1]))
+    array([ 1.,  0., -1., -1.])
+
+    """)
+
+add_newdoc('mkl_umath', 'exp10',
+    """
+    Calculate `10**x` for all `x` in the input array.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    out : ndarray
+        Element-wise 10 to the power `x`.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    exp, exp2, power
+
+    Examples
+    --------
+    >>> mkl_umath.exp10(np.array([0., 1., -2.]))
+    array([ 1.  , 10.  ,  0.01])
+
+    """)
+
+add_newdoc('mkl_umath', 'sind',
+    """
+    Sine of an angle in degrees, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Angle, in degrees.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        The sine of each element of `x`. The angle is reduced in degrees
+        without rounding error before the conversion to radians, so the
+        results are exact at the multiples of 90 degrees, also for large
+        angles.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    cosd, tand, arcsind, sin
+
+    Examples
+    --------
+    >>> mkl_umath.sind(np.array([0., 90., 180., 270., 3.6e20]))
+    array([ 0.,  1.,  0., -1.,  0.])
+
+    """)
+
+add_newdoc('mkl_umath', 'cosd',
+    """
+    Cosine of an angle in degrees, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Angle, in degrees.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        The cosine of each element of `x`. The angle is reduced in degrees
+        without rounding error before the conversion to radians, so the
+        results are exact at the multiples of 90 degrees, also for large
+        angles.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    sind, tand, arccosd, cos
+
+    Examples
+    --------
+    >>> mkl_umath.cosd(np.array([0., 90., 180., 360.]))
+    array([ 1.,  0., -1.,  1.])
+
+    """)
+
+add_newdoc('mkl_umath', 'tand',
+    """
+    Tangent of an angle in degrees, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Angle, in degrees.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        The tangent of each element of `x`, reduced like `sind`. It is
+        `inf` at 90 degrees and `-inf` at -90 degrees, modulo 360.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    sind, cosd, arctand, tan
+
+    Examples
+    --------
+    >>> mkl_umath.tand(np.array([0., 45., 180.]))
+    array([0., 1., 0.])
+
+    """)
+
+add_newdoc('mkl_umath', 'arcsind',
+    """
+    Inverse sine in degrees, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        `y`-coordinate on the unit circle.
+    $PARAMS
+
+    Returns
+    -------
+    angle : ndarray
+        The inverse sine of each element in `x`, in degrees in the closed
+        interval ``[-90, 90]``.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    sind, arcsin
+
+    Examples
+    --------
+    >>> mkl_umath.arcsind(np.array([-1., 0., 1.]))
+    array([-90.,   0.,  90.])
+
+    """)
+
+add_newdoc('mkl_umath', 'arccosd',
+    """
+    Inverse cosine in degrees, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        `x`-coordinate on the unit circle.
+    $PARAMS
+
+    Returns
+    -------
+    angle : ndarray
+        The inverse cosine of each element in `x`, in degrees in the closed
+        interval ``[0, 180]``.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    cosd, arccos
+
+    Examples
+    --------
+    >>> mkl_umath.arccosd(np.array([1., 0., -1.]))
+    array([  0.,  90., 180.])
+
+    """)
+
+add_newdoc('mkl_umath', 'arctand',
+    """
+    Inverse tangent in degrees, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    angle : ndarray
+        The inverse tangent of each element in `x`, in degrees in the
+        interval ``[-90, 90]``.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    tand, arctan
+
+    Examples
+    --------
+    >>> mkl_umath.arctand(np.array([0., 1., np.inf]))
+    array([ 0., 45., 90.])
+
+    """)
+
+add_newdoc('mkl_umath', 'reciprocal',
+    """
+    Return the reciprocal of the argument, element-wise.
+
+    Calculates ``1/x`` with a correctly rounded division.
+
+    Parameters
+    ----------
+    x : array_like
+        Input array.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        Return array.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    recip
+
+    Notes
+    -----
+    Only float32 and float64 loops are provided: integer inputs are
+    converted to float64, so ``reciprocal(2)`` is 0.5 and not the 0 of
+    integer division that ``np.reciprocal`` returns. `use_in_numpy`
+    replaces the float32 and float64 loops of ``np.reciprocal`` with these,
+    which are not affected by `set_refinement_steps`.
+
+    Examples
+    --------
+    >>> mkl_umath.reciprocal(np.array([1, 2, 4]))
+    array([1.  , 0.5 , 0.25])
+
+    """)
+
+add_newdoc('mkl_umath', 'recip',
+    """
+    Return the reciprocal of the argument, element-wise, with a selectable
+    accuracy.
+
+    Parameters
+    ----------
+    x : array_like
+        Input array.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        ``1/x`` for each element of `x`.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    reciprocal, rsqrt, set_refinement_steps
+
+    Notes
+    -----
+    By default the result is ``1/x`` rounded correctly, like `reciprocal`.
+    After ``set_refinement_steps(n)`` it is the hardware estimate refined by
+    `n` Newton-Raphson steps instead, with about 8, 16 and 32 correct bits
+    for 0, 1 and 2 steps. Unlike `reciprocal`, `recip` is not a NumPy ufunc
+    and `use_in_numpy` leaves it alone.
+
+    Examples
+    --------
+    >>> mkl_umath.recip(np.array([1., 2., 4.]))
+    array([1.  , 0.5 , 0.25])
+
+    """)
+
+add_newdoc('mkl_umath', 'rsqrt',
+    """
+    Return the reciprocal of the square root of the input, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        The values whose reciprocal square root is required.
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        ``1/sqrt(x)`` for each element of `x`, NaN for negative `x`.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    sqrt, recip, set_refinement_steps
+
+    Notes
+    -----
+    By default the result is the correctly rounded square root divided
+    into 1. After ``set_refinement_steps(n)`` it is the hardware estimate
+    refined by `n` Newton-Raphson steps instead, with about 8, 16 and 32
+    correct bits for 0, 1 and 2 steps.
+
+    Examples
+    --------
+    >>> mkl_umath.rsqrt(np.array([4., 0.25, np.inf]))
+    array([0.5, 2. , 0. ])
+
+    """)
+
+add_newdoc('mkl_umath', 'expit',
+    """
+    Logistic sigmoid, ``1/(1 + exp(-x))``, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    out : ndarray
+        The sigmoid of each element of `x`, in the closed interval
+        ``[0, 1]``.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    silu, softplus
+
+    Notes
+    -----
+    The exponential is of ``-abs(x)`` only, so that no intermediate result
+    overflows and no temporary array is allocated.
+
+    Examples
+    --------
+    >>> mkl_umath.expit(np.array([-np.inf, -1., 0., 1., np.inf]))
+    array([0.        , 0.26894142, 0.5       , 0.73105858, 1.        ])
+
+    """)
+
+add_newdoc('mkl_umath', 'softplus',
+    """
+    Softplus, ``log(1 + exp(x))``, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    out : ndarray
+        The softplus of each element of `x`, computed as
+        ``maximum(x, 0) + log1p(exp(-abs(x)))`` so that it does not
+        overflow for large `x`.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    expit, logaddexp
+
+    Examples
+    --------
+    >>> mkl_umath.softplus(np.array([-np.inf, -1., 0., 1., np.inf]))
+    array([0.        , 0.31326169, 0.69314718, 1.31326169,        inf])
+
+    """)
+
+add_newdoc('mkl_umath', 'gelu',
+    """
+    Gaussian error linear unit, ``x/2*(1 + erf(x/sqrt(2)))``, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    out : ndarray
+        `x` times the standard normal cumulative distribution at `x`,
+        computed with ``erfc(-x/sqrt(2))`` to keep its accuracy for
+        negative `x`.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    gelu_tanh, erf, erfc
+
+    Examples
+    --------
+    >>> mkl_umath.gelu(np.array([-3., -1., 0., 1., 3.]))
+    array([-0.00404969, -0.15865525,  0.        ,  0.84134475,  2.99595031])
+
+    """)
+
+add_newdoc('mkl_umath', 'gelu_tanh',
+    """
+    Tanh approximation of the Gaussian error linear unit, element-wise.
+
+    Computes ``x/2*(1 + tanh(sqrt(2/pi)*(x + 0.044715*x**3)))``.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    out : ndarray
+        The approximate GELU of each element of `x`.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    gelu
+
+    Notes
+    -----
+    ``(1 + tanh(z))/2`` is evaluated as ``expit(2*z)``, which does not lose
+    accuracy for negative `x`.
+
+    Examples
+    --------
+    >>> mkl_umath.gelu_tanh(np.array([-3., -1., 0., 1., 3.]))
+    array([-0.00363739, -0.15880801,  0.        ,  0.84119199,  2.99636261])
+
+    """)
+
+add_newdoc('mkl_umath', 'silu',
+    """
+    Sigmoid linear unit, ``x/(1 + exp(-x))``, element-wise.
+
+    Parameters
+    ----------
+    x : array_like
+        Input values.
+    $PARAMS
+
+    Returns
+    -------
+    out : ndarray
+        `x` times the sigmoid of `x`.
+        $OUT_SCALAR_1
+
+    See Also
+    --------
+    expit
+
+    Examples
+    --------
+    >>> mkl_umath.silu(np.array([-3., -1., 0., 1., 3.]))
+    array([-0.14227762, -0.26894142,  0.        ,  0.73105858,  2.85772238])
+
+    """)
+
+add_newdoc('mkl_umath', 'fma',
+    """
+    Fused multiply-add, ``x1 * x2 + x3`` with a single rounding,
+    element-wise.
+
+    Parameters
+    ----------
+    x1, x2 : array_like
+        The factors.
+    x3 : array_like
+        The addend. If the shapes of `x1`, `x2` and `x3` differ, they must
+        be broadcastable to a common shape (which becomes the shape of the
+        output).
+    $PARAMS
+
+    Returns
+    -------
+    y : ndarray
+        The exact ``x1 * x2 + x3`` rounded once to the result type.
+        This is a scalar if `x1`, `x2` and `x3` are scalars.
+
+    Notes
+    -----
+    The result is computed in a single pass, without the temporary array
+    of ``x1 * x2``. Inputs that are scalars or broadcast along the loop,
+    e.g. the coefficients of an affine transform, are loaded only once.
+
+    Examples
+    --------
+    >>> x = np.arange(4.)
+    >>> mkl_umath.fma(2., x, 1.)
+    array([1., 3., 5., 7.])
+
+    """)